@@ -1,16 +1,37 @@
-import re
 import os
+import sys
 
 class Contacto:
     """
     Representa un contacto con nombre, teléfono y correo electrónico.
     """
 
+    # Sin __dict__ por instancia: menos memoria y acceso más rápido a atributos
+    __slots__ = ('_nombre', '_telefono', '_email', '_nombre_lower', '_line_bytes')
+
     def __init__(self, nombre: str, telefono: str, email: str):
         # Almacena los atributos, eliminando espacios en los extremos
-        self.nombre = nombre.strip()
-        self.telefono = telefono.strip()
-        self.email = email.strip()
+        self._nombre = nombre.strip()
+        self._telefono = telefono.strip()
+        self._email = email.strip()
+        # Nombre en minúsculas calculado una sola vez para las comparaciones
+        self._nombre_lower = self._nombre.lower()
+        # Línea ya codificada en UTF-8, lista para escribirse en el archivo
+        self._line_bytes = self.to_line().encode('utf-8')
+
+    # Los campos son de solo lectura: así la clave del índice y la línea
+    # codificada nunca quedan desfasadas respecto a los datos
+    @property
+    def nombre(self) -> str:
+        return self._nombre
+
+    @property
+    def telefono(self) -> str:
+        return self._telefono
+
+    @property
+    def email(self) -> str:
+        return self._email
 
     def __str__(self):
         # Define cómo se muestra un contacto por pantalla
@@ -41,46 +62,123 @@ class GestionContactos:
     Gestiona una lista de contactos con persistencia en un archivo de texto.
     """
 
-    def __init__(self, archivo: str = 'contactos.txt'):
+    def __init__(self, archivo: str = 'contactos.txt', sincronizar: bool = False):
         self.archivo = archivo
+        self.sincronizar = sincronizar  # Si es True, hace fsync tras cada escritura
         self.contactos = []             # Lista interna de objetos Contacto
+        self._index: dict[str, Contacto] = {}   # Índice por nombre en minúsculas
+        self._fh = None                 # Archivo abierto durante toda la sesión
+        self._falta_salto = False       # True si el archivo no termina en '\n'
         self._cargar_contactos()        # Al iniciar, intenta cargar contactos previos
 
+    def _abrir(self):
+        """
+        Devuelve el archivo abierto en modo 'ab', abriéndolo solo en la
+        primera escritura. Se reutiliza en todas las escrituras siguientes.
+        """
+        if self._fh is None:
+            self._fh = open(self.archivo, 'ab')
+        return self._fh
+
+    def _persistir(self):
+        """
+        Vacía el buffer al sistema operativo y, si se pidió durabilidad
+        estricta, fuerza la escritura en disco con fsync.
+        """
+        self._fh.flush()
+        if self.sincronizar:
+            os.fsync(self._fh.fileno())
+
+    def cerrar(self):
+        """
+        Cierra el archivo de contactos si está abierto.
+        """
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # Permite usar el gestor con 'with' y cierra el archivo al salir
+        self.cerrar()
+
     def _cargar_contactos(self):
         """
-        Lee todas las líneas del archivo (si existe) y crea un Contacto
-        por cada línea válida. Ignora líneas mal formateadas.
+        Lee el archivo completo (si existe) de una sola vez y crea un
+        Contacto por cada línea válida. Ignora líneas mal formateadas.
         """
         if not os.path.exists(self.archivo):
             return  # Si no existe el archivo, no hace nada
         try:
-            with open(self.archivo, 'r', encoding='utf-8') as f:
-                for linea in f:
-                    try:
-                        contacto = Contacto.from_line(linea)
-                        self.contactos.append(contacto)
-                    except ValueError:
-                        # Aviso si hay una línea con error de formato
-                        print(f"Advertencia: línea ignorada por formato inválido: {linea.strip()}")
+            # Lectura aparte en modo 'rb': un archivo de solo lectura
+            # debe poder cargarse aunque no se pueda escribir en él
+            with open(self.archivo, 'rb') as f:
+                datos = f.read()
         except IOError as e:
             print(f"Error al leer el archivo: {e}")
+            return
+        # Un archivo editado a mano puede no acabar en salto de línea
+        self._falta_salto = bool(datos) and not datos.endswith(b'\n')
+        # Solo '\n' separa líneas: splitlines() también cortaría en
+        # caracteres como '\x85' o '\u2028' que pueden ir dentro de un campo
+        lineas = datos.decode('utf-8').split('\n')
+        if lineas[-1] == '':
+            lineas.pop()    # El salto final no abre una línea nueva
+        for linea in lineas:
+            # Mismo formato que from_line, pero con una comprobación
+            # en lugar de lanzar y capturar ValueError por línea
+            partes = linea.strip().split(';')
+            if len(partes) != 3:
+                # Aviso si hay una línea con error de formato
+                print(f"Advertencia: línea ignorada por formato inválido: {linea.strip()}")
+                continue
+            # Internar los campos comparte en memoria los valores repetidos
+            contacto = Contacto(sys.intern(partes[0].strip()),
+                                sys.intern(partes[1].strip()),
+                                sys.intern(partes[2].strip()))
+            self.contactos.append(contacto)
+            # Si hay nombres repetidos, el índice apunta al primero
+            self._index.setdefault(contacto._nombre_lower, contacto)
 
     def _guardar_contactos(self):
         """
         Sobrescribe el archivo entero con la lista actual de contactos,
-        usando el método to_line de cada uno.
+        usando la línea ya codificada de cada uno. Todo el contenido se
+        construye en memoria y se escribe de una sola vez en binario.
         """
         try:
-            with open(self.archivo, 'w', encoding='utf-8') as f:
-                for c in self.contactos:
-                    f.write(c.to_line())
+            f = self._abrir()
+            f.seek(0)
+            f.truncate()
+            f.write(b''.join(c._line_bytes for c in self.contactos))
+            self._persistir()
+            self._falta_salto = False
+        except IOError as e:
+            print(f"Error al escribir en el archivo: {e}")
+
+    def _append_contacto(self, c: Contacto):
+        """
+        Añade al final del archivo solo la línea del contacto indicado,
+        sin reescribir el resto.
+        """
+        try:
+            # En modo 'a' la escritura siempre va al final del archivo
+            f = self._abrir()
+            if self._falta_salto:
+                # Evita pegar la nueva línea a la última del archivo
+                f.write(b'\n')
+            f.write(c._line_bytes)
+            self._persistir()
+            self._falta_salto = False
         except IOError as e:
             print(f"Error al escribir en el archivo: {e}")
 
     def agregar_contacto(self, nombre: str, telefono: str, email: str):
         """
         Valida los datos y agrega un nuevo contacto a la lista.
-        Luego guarda los cambios en el archivo.
+        Luego añade la nueva línea al final del archivo.
         """
         # 1. Campos obligatorios
         if not nombre or not telefono or not email:
@@ -88,14 +186,15 @@ class GestionContactos:
         # 2. Validación de formato de email
         if not self._validar_email(email):
             raise ValueError("Formato de correo electrónico inválido")
-        # 3. Comprobar duplicado (case-insensitive)
-        if any(c.nombre.lower() == nombre.lower() for c in self.contactos):
-            raise ValueError("El contacto ya existe")
-        # 4. Crear y añadir
+        # 3. Crear el contacto: su nombre en minúsculas sirve de clave
         nuevo = Contacto(nombre, telefono, email)
+        # 4. Comprobar duplicado (case-insensitive) y añadir
+        if nuevo._nombre_lower in self._index:
+            raise ValueError("El contacto ya existe")
         self.contactos.append(nuevo)
+        self._index[nuevo._nombre_lower] = nuevo
         # 5. Persistir en disco
-        self._guardar_contactos()
+        self._append_contacto(nuevo)
 
     def mostrar_todos(self):
         """
@@ -113,31 +212,48 @@ class GestionContactos:
         Busca un contacto por nombre exacto (sin importar mayúsculas/minúsculas).
         Devuelve el objeto Contacto o lanza LookupError si no existe.
         """
-        for c in self.contactos:
-            if c.nombre.lower() == nombre.lower():
-                return c
-        raise LookupError("Contacto no encontrado")
+        c = self._index.get(nombre.lower())
+        if c is None:
+            raise LookupError("Contacto no encontrado")
+        return c
 
     def eliminar_contacto(self, nombre: str):
         """
         Elimina de la lista el primer contacto cuyo nombre coincida
         (case-insensitive). Guarda los cambios o lanza LookupError si no existe.
         """
-        for i, c in enumerate(self.contactos):
-            if c.nombre.lower() == nombre.lower():
-                del self.contactos[i]
-                self._guardar_contactos()
-                return
-        raise LookupError("Contacto no encontrado")
+        clave = nombre.lower()
+        c = self._index.pop(clave, None)
+        if c is None:
+            raise LookupError("Contacto no encontrado")
+        self.contactos.remove(c)
+        # Si el archivo traía otro contacto con el mismo nombre,
+        # el índice pasa a apuntar al siguiente de la lista
+        for otro in self.contactos:
+            if otro._nombre_lower == clave:
+                self._index[clave] = otro
+                break
+        self._guardar_contactos()
 
     @staticmethod
     def _validar_email(email: str) -> bool:
         """
-        Comprueba mediante una expresión regular que el email
-        tenga un formato básico válido: algo@algo.algo
+        Comprueba que el email tenga un formato básico válido:
+        algo@algo.algo, con una extensión de al menos 2 caracteres.
+        Recorre la cadena directamente, sin expresiones regulares.
         """
-        patron = r'^[\w\.-]+@[\w\.-]+\.\w{2,}$'
-        return re.match(patron, email) is not None
+        local, arroba, dominio = email.partition('@')
+        if not arroba or not local:
+            return False
+        # La extensión final va tras el último punto: al menos 2 letras, dígitos o '_'
+        punto = dominio.rfind('.')
+        if punto < 1 or len(dominio) - punto < 3:
+            return False
+        extension = dominio[punto + 1:]
+        if not all(ch.isalnum() or ch == '_' for ch in extension):
+            return False
+        # Usuario y resto del dominio: letras, dígitos, '_', '.' o '-' (sin otra '@')
+        return all(ch.isalnum() or ch in '_.-' for ch in local + dominio[:punto])
 
 
 def menu():
@@ -154,46 +270,63 @@ def menu():
         '4': 'Eliminar contacto',
         '5': 'Salir'
     }
-    while True:
-        print("\n=== Menú de Gestión de Contactos ===")
-        for clave, desc in opciones.items():
-            print(f"{clave}. {desc}")
-        eleccion = input("Seleccione una opción: ").strip()
 
-        try:
-            if eleccion == '1':
-                nombre = input("Nombre: ")
-                telefono = input("Teléfono: ")
-                email = input("Email: ")
-                gestor.agregar_contacto(nombre, telefono, email)
-                print("Contacto agregado exitosamente.")
-
-            elif eleccion == '2':
-                print("\nLista de contactos:")
-                gestor.mostrar_todos()
-
-            elif eleccion == '3':
-                nombre = input("Nombre a buscar: ")
-                contacto = gestor.buscar_contacto(nombre)
-                print("Contacto encontrado:")
-                print(contacto)
-
-            elif eleccion == '4':
-                nombre = input("Nombre a eliminar: ")
-                gestor.eliminar_contacto(nombre)
-                print("Contacto eliminado exitosamente.")
-
-            elif eleccion == '5':
-                print("Saliendo del programa.")
-                break
+    # accion_salir devuelve True para terminar el bucle
+    def accion_agregar():
+        nombre = input("Nombre: ")
+        telefono = input("Teléfono: ")
+        email = input("Email: ")
+        gestor.agregar_contacto(nombre, telefono, email)
+        print("Contacto agregado exitosamente.")
 
-            else:
-                print("Opción no válida. Intente de nuevo.")
+    def accion_mostrar():
+        print("\nLista de contactos:")
+        gestor.mostrar_todos()
+
+    def accion_buscar():
+        nombre = input("Nombre a buscar: ")
+        contacto = gestor.buscar_contacto(nombre)
+        print("Contacto encontrado:")
+        print(contacto)
+
+    def accion_eliminar():
+        nombre = input("Nombre a eliminar: ")
+        gestor.eliminar_contacto(nombre)
+        print("Contacto eliminado exitosamente.")
 
-        except ValueError as ve:
-            print(f"Error: {ve}")    # Errores de validación de entrada
-        except LookupError as le:
-            print(f"Error: {le}")   # Errores de búsqueda o eliminación
+    def accion_salir():
+        print("Saliendo del programa.")
+        return True
+
+    # Tabla de despacho: una búsqueda en el diccionario por cada elección
+    acciones = {
+        '1': accion_agregar,
+        '2': accion_mostrar,
+        '3': accion_buscar,
+        '4': accion_eliminar,
+        '5': accion_salir
+    }
+    # El archivo se cierra también si el bucle termina por EOF o Ctrl-C
+    try:
+        while True:
+            print("\n=== Menú de Gestión de Contactos ===")
+            for clave, desc in opciones.items():
+                print(f"{clave}. {desc}")
+            eleccion = input("Seleccione una opción: ").strip()
+
+            accion = acciones.get(eleccion)
+            if accion is None:
+                print("Opción no válida. Intente de nuevo.")
+                continue
+            try:
+                if accion():
+                    break
+            except ValueError as ve:
+                print(f"Error: {ve}")    # Errores de validación de entrada
+            except LookupError as le:
+                print(f"Error: {le}")   # Errores de búsqueda o eliminación
+    finally:
+        gestor.cerrar()
 
 if __name__ == '__main__':
     menu()
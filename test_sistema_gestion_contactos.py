@@ -0,0 +1,62 @@
+import builtins
+
+import pytest
+
+from sistema_gestion_contactos import GestionContactos
+
+
+def test_agregar_a_archivo_sin_salto_final(tmp_path):
+    ruta = tmp_path / 'contactos.txt'
+    ruta.write_bytes(b'Ana;1;ana@x.com')
+    with GestionContactos(str(ruta)) as gestor:
+        gestor.agregar_contacto('Nuevo', '123', 'a@b.com')
+    assert ruta.read_bytes() == b'Ana;1;ana@x.com\nNuevo;123;a@b.com\n'
+    with GestionContactos(str(ruta)) as gestor:
+        assert [c.nombre for c in gestor.contactos] == ['Ana', 'Nuevo']
+
+
+def test_nombres_con_espacios_raros_sobreviven_a_la_recarga(tmp_path):
+    ruta = str(tmp_path / 'contactos.txt')
+    nombres = ['Bob\x85x', 'Eva Luz', 'Tab\x0bula', 'Fin\x0cal']
+    with GestionContactos(ruta) as gestor:
+        for i, nombre in enumerate(nombres):
+            gestor.agregar_contacto(nombre, str(i), f'c{i}@x.com')
+    with GestionContactos(ruta) as gestor:
+        assert [c.nombre for c in gestor.contactos] == nombres
+
+
+def test_archivo_de_solo_lectura_se_carga(tmp_path, monkeypatch):
+    ruta = tmp_path / 'contactos.txt'
+    ruta.write_bytes(b'Ana;1;ana@x.com\n')
+    open_real = builtins.open
+
+    # Simula un archivo sin permiso de escritura (también si se ejecuta como root)
+    def open_solo_lectura(archivo, modo='r', *args, **kwargs):
+        if archivo == str(ruta) and modo != 'rb':
+            raise PermissionError(13, 'Permission denied', archivo)
+        return open_real(archivo, modo, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, 'open', open_solo_lectura)
+    with GestionContactos(str(ruta)) as gestor:
+        assert gestor.buscar_contacto('ana').telefono == '1'
+
+
+def test_agregar_y_recargar(tmp_path):
+    ruta = str(tmp_path / 'contactos.txt')
+    with GestionContactos(ruta) as gestor:
+        gestor.agregar_contacto('Juan Pérez', '600123456', 'juan@example.com')
+        gestor.agregar_contacto('María', '600987654', 'maria@example.org')
+    with GestionContactos(ruta) as gestor:
+        assert [c.nombre for c in gestor.contactos] == ['Juan Pérez', 'María']
+        assert gestor.buscar_contacto('JUAN PÉREZ').email == 'juan@example.com'
+
+
+def test_eliminar_uno_de_dos_nombres_que_solo_difieren_en_mayusculas(tmp_path):
+    ruta = tmp_path / 'contactos.txt'
+    ruta.write_bytes(b'Ana;1;a@b.com\nana;2;c@d.com\n')
+    with GestionContactos(str(ruta)) as gestor:
+        gestor.eliminar_contacto('ana')
+        assert gestor.buscar_contacto('ANA').telefono == '2'
+        with pytest.raises(ValueError):
+            gestor.agregar_contacto('Ana', '3', 'e@f.com')
+    assert ruta.read_bytes() == b'ana;2;c@d.com\n'